@@ -10,40 +10,101 @@
     Inspiration: https://github.com/elgohr/EPEX-DE-History
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime,timedelta
+from io import BytesIO
+import gzip
+import hashlib
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+import numpy as np
 import pandas as pd
 import warnings
 import os
 import random
 import time
-import requests
-from bs4 import BeautifulSoup
 import urllib3
 
+# PyArrow's multithreaded C++ CSV writer is used when available; pandas'
+# Python-level writer remains the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
 warnings.simplefilter(action='ignore', category=FutureWarning)
 
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36'
+}
+
+# One pooled session for the whole run: keep-alive amortizes the TLS
+# handshake across all fetches, and the pool size covers the thread pool
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+# Offset templates for the time axes; computed once at import so each fetch
+# only pays for a single Timestamp + TimedeltaIndex addition
+_HOUR_OFFSETS_0 = pd.to_timedelta(np.arange(24), unit='h')
+_HOUR_OFFSETS_12 = pd.to_timedelta(np.arange(12, 24), unit='h')
+_MIN15_OFFSETS = pd.to_timedelta(np.arange(0, 24 * 60, 15), unit='m')
+_MIN30_OFFSETS = pd.to_timedelta(np.arange(0, 24 * 60, 30), unit='m')
+
+# Responses for delivery dates older than this many days are final on the
+# EPEX side (see module docstring) and can be cached on disk forever
+_CACHE_DIR = "./cache"
+_STABLE_AFTER_DAYS = 2
+
+def _fetch_html(url:str, date_str:str) -> bytes:
+    # Serve settled days from the on-disk cache so reruns skip the HTTPS
+    # round trip; recent (still mutable) days are always refetched
+    stable = pd.Timestamp(date_str) < pd.Timestamp(datetime.today().date()) - timedelta(days=_STABLE_AFTER_DAYS)
+    cache_path = os.path.join(_CACHE_DIR, hashlib.md5(url.encode()).hexdigest() + ".html.gz")
+
+    if stable and os.path.isfile(cache_path):
+        with gzip.open(cache_path, 'rb') as f:
+            return f.read()
+
+    # Option 1: Use verify=False (not secure)
+    response = _SESSION.get(url, verify=False, timeout=30)
+    # Option 2: Manually specify CA bundle
+    # response = _SESSION.get(url, verify='path/to/cacert.pem')
+
+    # Only persist bodies that are worth replaying: an error page (e.g. a
+    # transient 503 from rate limiting) or a table-less body cached for a
+    # settled date would be served forever and silently blank that date
+    if stable and response.ok and b'<table' in response.content:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with gzip.open(cache_path, 'wb') as f:
+            f.write(response.content)
+
+    return response.content
+
 def get_time_axis_hour(date_str:str,start_hour:int) -> pd.Series :
-    index_hours = [
-        "00 - 01", "01 - 02", "02 - 03", "03 - 04", "04 - 05", "05 - 06",
-        "06 - 07", "07 - 08", "08 - 09", "09 - 10", "10 - 11", "11 - 12",
-        "12 - 13", "13 - 14", "14 - 15", "15 - 16", "16 - 17", "17 - 18",
-        "18 - 19", "19 - 20", "20 - 21", "21 - 22", "22 - 23", "23 - 24"
-    ]
-    if start_hour == 12:
-        index_hours = index_hours[int(len(index_hours)/2):]
-
-    # Convert to Pandas Series
-    series_hours = pd.Series(index_hours)
-
-    # Function to parse the hour and convert to timestamp
-    def parse_hour_to_timestamp(hour_str):
-        hour = int(hour_str.split(' - ')[0])  # Split the string and convert the first part to an integer
-        timestamp = pd.to_datetime(f"{date_str} {hour}:00:00")  # Create a timestamp string and convert to datetime
-        return timestamp
-
-    return series_hours.apply(parse_hour_to_timestamp)
+    offsets = _HOUR_OFFSETS_12 if start_hour == 12 else _HOUR_OFFSETS_0
+    return pd.Series(pd.Timestamp(date_str) + offsets)
+
+# Canonical output schemas: per-date frames are reindexed to these column
+# orders and numeric columns cast to float64, so the per-area concat joins
+# identically-typed blocks instead of consolidating mixed ones
+_CANON_SPOT_COLS = [
+    'date', 'low', 'high', 'last', 'weighted_avg', 'id_full', 'id1', 'id3',
+    'buy_volume', 'sell_volume', 'total_volume'
+]
+_CANON_AUCTION_COLS = ['date', 'Buy_Volume', 'Sell_Volume', 'Volume', 'Price']
+
+# Supported spot-table lengths -> (row stride, truncate-to). A truncation
+# marks a Long Clock Change Day (25 hours), which is warned about on use
+_SPOT_SHAPES = {
+    168: (7, None),   # 15 min intervals
+    72:  (3, None),   # 30 min intervals
+    74:  (3, 24),     # 30 min intervals, long clock change day
+    24:  (1, None),   # hourly
+    172: (7, 24),     # 15 min intervals, long clock change day
+    174: (7, 24),     # 15 min intervals, long clock change day
+}
 
 def fetch_spot_data(date_str:str, url:str) -> pd.DataFrame:
     # Fetch the webpage
@@ -51,63 +112,39 @@ def fetch_spot_data(date_str:str, url:str) -> pd.DataFrame:
     # Disable SSL warnings (if skipping verification)
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-    url = 'https://www.epexspot.com/en/market-results?market_area=AT&auction=&trading_date=&delivery_date=2025-01-20&underlying_year=&modality=Continuous&sub_modality=&technology=&data_mode=table&period=&production_period=&product=60'
-
-    session = requests.Session()
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36'
-    }
-
     try:
-        # Option 1: Use verify=False (not secure)
-        response = session.get(url, headers=headers, verify=False)
-        # Option 2: Manually specify CA bundle
-        # response = session.get(url, headers=headers, verify='path/to/cacert.pem')
-        # print(session.cookies.get_dict())  # Debug cookies
-        # Parse the HTML content
-        soup = BeautifulSoup(response.text, 'html.parser')
-        # Find the table
-        table = soup.find('table')
+        content = _fetch_html(url, date_str)
     except requests.exceptions.SSLError as e:
         raise Exception(f"SSL error: \n{e}")
     except Exception as e:
         raise Exception(f"An error occurred: \n{e}")
 
-
-    # Convert the table to a DataFrame, if a table is found
-    data_frame = pd.read_html(str(table))[0] if table else None
-    if data_frame is None:
+    # Convert the first table to a DataFrame directly (single lxml parse,
+    # no intermediate BeautifulSoup pass over the page)
+    try:
+        # Feed the raw bytes to lxml and let it detect the encoding itself —
+        # no up-front decode of the whole payload to str
+        data_frame = pd.read_html(BytesIO(content), flavor='lxml', match='.+')[0]
+    except ValueError:
+        # read_html raises ValueError when the page contains no table
         print(f"DATA NOT FOUND FOR: {url}")
         return pd.DataFrame()
 
     # print(f"Data size {len(data_frame)}")
 
-    # Display the DataFrame
-    data_frame = pd.DataFrame(data_frame)
-
-    if len(data_frame) == 168:
-        # get hourly data (skip 15 min intervals)
-        data_frame_lim = data_frame.iloc[::7]
-    elif len(data_frame) == 72:
-        # get hourly data (skip 30 min intervals)
-        data_frame_lim = data_frame.iloc[::3]
-    elif len(data_frame) == 74:
-        # get hourly data (skip 30 min intervals)
-        print(f'WARNING data length ({len(data_frame)}) suggests Long Clock Change Day with 25 hours. Collection might be erroneous')
-        data_frame_lim = data_frame.iloc[::3]
-        data_frame_lim = data_frame_lim.iloc[:24]  # Adjust to include 25 hours for the day
-    elif len(data_frame) == 24:
-        # get hourly data (skip 1 hour intervals)
-        data_frame_lim = data_frame
-        pass
-    elif len(data_frame) == 172 or len(data_frame) == 174:
-        # Special handling for "Long Clock Change Day" (skip 15 min intervals but account for extra hour)
-        print(f'WARNING data length ({len(data_frame)}) suggests Long Clock Change Day with 25 hours. Collection might be erroneous')
-        data_frame_lim = data_frame.iloc[::7]
-        # data_frame_lim = data_frame_lim.iloc[:25]  # Adjust to include 25 hours for the day
-        data_frame_lim = data_frame_lim.iloc[:24]  # Adjust to include 25 hours for the day
-    else:
-        raise ValueError(f"Data size {len(data_frame)} not supported (see 168 for 15min and 72 for 30min)")
+    n_rows = len(data_frame)
+    if n_rows not in _SPOT_SHAPES:
+        raise ValueError(f"Data size {n_rows} not supported (see 168 for 15min and 72 for 30min)")
+    stride, limit = _SPOT_SHAPES[n_rows]
+    if limit is not None:
+        print(f'WARNING data length ({n_rows}) suggests Long Clock Change Day with 25 hours. Collection might be erroneous')
+
+    # Down-select with precomputed integer positions before any timestamp or
+    # NaN work, so the downstream passes only touch the kept hourly rows
+    keep = np.arange(0, n_rows, stride)
+    if limit is not None:
+        keep = keep[:limit]
+    data_frame_lim = data_frame.take(keep)
 
     # Function to parse the hour and convert to timestamp add timestamp column  and Convert to Pandas Series
     data_frame_lim.index = get_time_axis_hour(date_str, 0)
@@ -116,8 +153,10 @@ def fetch_spot_data(date_str:str, url:str) -> pd.DataFrame:
     data_frame_lim = data_frame_lim.reset_index().rename(columns={'index': 'date'})
     #data_frame_lim.reset_index(inplace=True)
 
-    # drop columns that are 100% nans
-    data_frame_lim.dropna(axis='columns', how='all', inplace=True)
+    # drop columns that are 100% nans (one SIMD-friendly numpy scan instead
+    # of pandas' generic dropna path)
+    keep_cols = data_frame_lim.notna().to_numpy().any(axis=0)
+    data_frame_lim = data_frame_lim.iloc[:, keep_cols]
 
     # map the column names for easy processing
     name_map = {
@@ -138,125 +177,86 @@ def fetch_spot_data(date_str:str, url:str) -> pd.DataFrame:
     }
     data_frame_lim = data_frame_lim.rename(columns=name_map)
 
+    # Canonical column order + float64 numerics; any unmapped column keeps
+    # its original header and goes last
+    canon = [c for c in _CANON_SPOT_COLS if c in data_frame_lim.columns]
+    others = [c for c in data_frame_lim.columns if c not in _CANON_SPOT_COLS]
+    data_frame_lim = data_frame_lim[canon + others]
+    num_cols = [c for c in canon if c != 'date']
+    data_frame_lim[num_cols] = data_frame_lim[num_cols].astype(np.float64)
+
     return data_frame_lim
 
 def get_time_axis_15min(date_str:str):
-    # Add timestamp column with 15-minute intervals
-    index_15min_intervals = [
-        f"{hour:02}:{minute:02}" for hour in range(24) for minute in range(0, 60, 15)
-    ]
-
-    # Convert to Pandas Series
-    series_15min = pd.Series(index_15min_intervals)
-
-    # Function to parse the time string and convert to timestamp
-    def parse_time_to_timestamp(time_str):
-        return pd.to_datetime(f"{date_str} {time_str}:00")
-
-    # Apply the function to each item in the series to create datetime objects
-    timestamps = series_15min.apply(parse_time_to_timestamp)
-
-    return timestamps
+    # Timestamp column with 15-minute intervals from the precomputed template
+    return pd.Series(pd.Timestamp(date_str) + _MIN15_OFFSETS)
 
 def get_time_axis_30min(date_str:str):
-    # Define the intervals for each 30 minutes
-    index_intervals = [
-                          f"{hour:02d}:00" for hour in range(24)
-                      ] + [
-                          f"{hour:02d}:30" for hour in range(24)
-                      ]
-
-    # Sort intervals since they are created in two halves (00:00, 01:00..., 23:00, 00:30, 01:30..., 23:30)
-    index_intervals = sorted(index_intervals, key=lambda x: (int(x.split(':')[0]), int(x.split(':')[1])))
-
-    # Convert to Pandas Series
-    series_intervals = pd.Series(index_intervals)
-
-    # Function to convert the hour-minute string to timestamp
-    def parse_interval_to_timestamp(time_str):
-        timestamp = pd.to_datetime(f"{date_str} {time_str}:00")  # Create a timestamp from date and time
-        return timestamp
-
-    # Apply the function to each item in the series to create timestamps
-    timestamps = series_intervals.apply(parse_interval_to_timestamp)
-    return timestamps
+    # Timestamp column with 30-minute intervals from the precomputed template
+    return pd.Series(pd.Timestamp(date_str) + _MIN30_OFFSETS)
+
+# Supported auction-table lengths -> (time-axis builder, truncate-to, log
+# template). A truncation drops the extra clock-change hour
+_AUCTION_SHAPES = {
+    12:  (lambda d: get_time_axis_hour(d, start_hour=12), None,
+          "Data size {n} (assuming hourly interval starting at 12.00"),
+    24:  (lambda d: get_time_axis_hour(d, start_hour=0), None,
+          "Data size {n} (assuming hourly interval starting at 00.00"),
+    48:  (get_time_axis_30min, None,
+          "Data size {n} (assuming half-hourly interval starting at 12.00"),
+    50:  (get_time_axis_30min, 48,
+          "WARNING Data size {n} (assuming half-hourly interval starting at 12.00 with extra hour"),
+    96:  (get_time_axis_15min, None,
+          "Data size {n} (assuming quarter-hourly interval starting at 12.00"),
+    100: (get_time_axis_15min, 96,
+          "WARNING Data size {n} (assuming quarter-hourly interval starting at 12.00 but with extra hour"),
+}
 
 def fetch_auction_data(delivery_date_str:str, url:str) -> pd.DataFrame:
 
     # Disable SSL warnings (if skipping verification)
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-    session = requests.Session()
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36'
-    }
-
     try:
-        # Option 1: Use verify=False (not secure)
-        response = session.get(url, headers=headers, verify=False)
-        # Parse the HTML content
-        soup = BeautifulSoup(response.text, 'html.parser')
+        content = _fetch_html(url, delivery_date_str)
     except requests.exceptions.SSLError as e:
         raise Exception(f"SSL error: \n{e}")
     except Exception as e:
         raise Exception(f"An error occurred: \n{e}")
 
-    # Initialize a list to hold all rows of data
-    data = []
-
-    # Find all rows in the table within <tr class="child"> and <tr class="child impair">
-    rows = soup.find_all('tr', class_=lambda x: x and 'child' in x)
-
-    # Iterate through each row and fetch columns
-    for row in rows:
-        cols = row.find_all('td')
-        cols = [ele.text.strip() for ele in cols]
-        data.append(cols)  # Add the column data to the list of rows
+    # Parse with lxml and pull the <tr class="child"> / <tr class="child impair">
+    # rows via XPath — a C-level pass, no per-cell bs4 objects
+    tree = lxml.html.fromstring(content)
+    rows = tree.xpath('//tr[contains(@class,"child")]')
+
+    # text_content() per cell keeps empty <td>s aligned (a flat td/text()
+    # XPath would silently drop them)
+    cells = [td.text_content() for row in rows for td in row.xpath('./td')]
+
+    # The table is always N x 4 numeric strings: strip, drop the thousands
+    # separators and cast in C-level passes over a reshaped array instead of
+    # going through an object-dtype DataFrame
+    if cells:
+        raw = np.char.strip(np.array(cells, dtype=str).reshape(-1, 4))
+        values = np.char.replace(raw, ',', '').astype(np.float64)
+    else:
+        values = np.empty((0, 4))
 
-    # Create a DataFrame using the extracted data
-    data_frame = pd.DataFrame(data, columns=[
+    data_frame = pd.DataFrame(values, columns=[
         'Buy Volume (MWh)', 'Sell Volume (MWh)', 'Volume (MWh)', 'Price (€/MWh)'
     ])
 
-    for col in data_frame.columns:
-        data_frame[col] = data_frame[col].str.replace(',', '').astype(float)
-
-    # Display the DataFrame
-    if len(data_frame) == 0:
+    n_rows = len(data_frame)
+    if n_rows == 0:
         print(f"DATA NOT FOUND FOR: {url}")
         return pd.DataFrame()
-        # elif len(data_frame) == 168:
-    elif len(data_frame) == 12:
-        # get hourly data (skip 1 hour intervals)
-        print(f"Data size {len(data_frame)} (assuming hourly interval starting at 12.00")
-        data_frame_lim = data_frame
-        data_frame_lim.index = get_time_axis_hour(delivery_date_str, start_hour=12)
-    elif len(data_frame) == 24:
-        print(f"Data size {len(data_frame)} (assuming hourly interval starting at 00.00")
-        # get hourly data (skip 1 hour intervals)
-        data_frame_lim = data_frame
-        data_frame_lim.index = get_time_axis_hour(delivery_date_str, start_hour=0)
-    elif len(data_frame) == 48:
-        print(f"Data size {len(data_frame)} (assuming half-hourly interval starting at 12.00")
-        # get hourly data (skip 30 min intervals)
-        data_frame_lim = data_frame
-        data_frame_lim.index = get_time_axis_30min(delivery_date_str)
-    elif len(data_frame) == 50:
-        print(f"WARNING Data size {len(data_frame)} (assuming half-hourly interval starting at 12.00 with extra hour")
-        # get hourly data (skip 30 min intervals)
-        data_frame_lim = data_frame[:48]
-        data_frame_lim.index = get_time_axis_30min(delivery_date_str)
-    elif len(data_frame) == 96:
-        print(f"Data size {len(data_frame)} (assuming quarter-hourly interval starting at 12.00")
-        # get hourly data (skip 15 min intervals)
-        data_frame_lim = data_frame
-        data_frame_lim.index = get_time_axis_15min(delivery_date_str)
-    elif len(data_frame) == 100:
-        print(f"WARNING Data size {len(data_frame)} (assuming quarter-hourly interval starting at 12.00 but with extra hour")
-        data_frame_lim = data_frame[:96]
-        data_frame_lim.index = get_time_axis_15min(delivery_date_str)
-    else:
-        raise ValueError(f"Data size {len(data_frame)} not supported (see 96 for 15min and 24 for 1hour)")
+    if n_rows not in _AUCTION_SHAPES:
+        raise ValueError(f"Data size {n_rows} not supported (see 96 for 15min and 24 for 1hour)")
+
+    time_axis, limit, message = _AUCTION_SHAPES[n_rows]
+    print(message.format(n=n_rows))
+    data_frame_lim = data_frame if limit is None else data_frame[:limit]
+    data_frame_lim.index = time_axis(delivery_date_str)
 
     # Apply the function to each item in the series
     # data_frame_lim = series_hours.apply(parse_hour_to_timestamp)
@@ -266,8 +266,10 @@ def fetch_auction_data(delivery_date_str:str, url:str) -> pd.DataFrame:
     data_frame_lim = data_frame_lim.reset_index().rename(columns={'index': 'date'})
     #data_frame_lim.reset_index(inplace=True)
 
-    # drop columns that are 100% nans
-    data_frame_lim.dropna(axis='columns', how='all', inplace=True)
+    # drop columns that are 100% nans (one SIMD-friendly numpy scan instead
+    # of pandas' generic dropna path)
+    keep_cols = data_frame_lim.notna().to_numpy().any(axis=0)
+    data_frame_lim = data_frame_lim.iloc[:, keep_cols]
 
     # map the column names for easy processing
     name_map = {
@@ -279,51 +281,103 @@ def fetch_auction_data(delivery_date_str:str, url:str) -> pd.DataFrame:
     }
     data_frame_lim = data_frame_lim.rename(columns=name_map)
 
+    # Canonical column order (values are already float64 from the numpy cast)
+    data_frame_lim = data_frame_lim[[c for c in _CANON_AUCTION_COLS if c in data_frame_lim.columns]]
+
     return data_frame_lim
 
 
 
+def _freq_alias(dates:pd.Series) -> str:
+    # O(1): the first step is enough to tell 15min/30min/hourly apart, no
+    # need for pandas' full frequency inference
+    delta = dates.iloc[1] - dates.iloc[0]
+    return {900: '15min', 1800: '30min', 3600: 'h'}.get(int(delta.total_seconds()), 'var')
+
+def _write_csv(df:pd.DataFrame, fname:str):
+    if pa is not None:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), fname)
+    else:
+        df.to_csv(fname, index=False)
+
+# All collected market areas (GB only trades in auctions, see module docstring)
+_CONTINUOUS_AREAS = [
+    'AT','BE','CH','DE','DK1','DK2','FI','FR','NL',
+    'NO1','NO2','NO3','NO4','NO5','PL','SE1','SE2','SE3','SE4'
+]
+_AUCTION_AREAS = [
+    'AT','BE','CH','DE-LU','DK1','DK2','FI','FR','GB','NL',
+    'NO1','NO2','NO3','NO4','NO5','PL','SE1','SE2','SE3','SE4'
+]
+
 def collect_continuous_market_data(start_date, end_date):
     market_type = 'continuous'
-    for market_area in [
-            'AT','BE','CH','DE','DK1','DK2','FI','FR','NL',
-            'NO1','NO2','NO3','NO4','NO5','PL','SE1','SE2','SE3','SE4'
-        ]:
-        df = pd.DataFrame()
+    # Every (market_area, date) request is independent, so batch them all
+    # into one pool instead of fetching area by area: concurrency is then
+    # bounded by max_workers rather than by the few dates within one area
+    tasks = []
+    for market_area in _CONTINUOUS_AREAS:
+        # Only the delivery date varies per area, so format the URL
+        # template once
+        url_tmpl = (
+            f"https://www.epexspot.com/en/market-data?market_area={market_area}"
+            "&auction=&trading_date=&delivery_date={date}&underlying_year=&modality=Continuous"
+            "&sub_modality=&technology=&data_mode=table&period=&production_period=&product=60"
+        )
 
         for date in pd.date_range(start=start_date, end=end_date):
             date_str = date.strftime("%Y-%m-%d")
             print(f"{market_type} | {market_area} | {date_str}")
+            tasks.append((market_area, date_str, url_tmpl.format(date=date_str)))
+
+    # The work is network-bound, so overlap the HTTPS round trips;
+    # max_workers keeps the request rate polite
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(
+            lambda task: fetch_spot_data(task[1], url=task[2]), tasks
+        ))
 
-            url = f"https://www.epexspot.com/en/market-data?market_area={market_area}&auction=&trading_date=&delivery_date={date_str}&underlying_year=&modality=Continuous&sub_modality=&technology=&data_mode=table&period=&production_period=&product=60"
+    # Group the frames per area; task order keeps each group chronological
+    grouped = {}
+    for (market_area, _, _), df_i in zip(tasks, results):
+        if not df_i is None:
+            grouped.setdefault(market_area, []).append(df_i)
 
-            df_i = fetch_spot_data(date_str,  url=url)
-            if not df_i is None:
-                df = pd.concat([df,df_i])
+    for market_area in _CONTINUOUS_AREAS:
+        # Concatenate once at the end; growing a DataFrame per date is quadratic
+        parts = grouped.get(market_area, [])
+        df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
 
-        df_sorted = df.sort_values(by='date')
+        # Tag the area as a categorical so cross-area concatenation downstream
+        # does not duplicate the string per row
+        df['market_area'] = pd.Categorical([market_area] * len(df), categories=_CONTINUOUS_AREAS)
 
-        if not os.path.isdir(f"./data/{market_area}"):
-            os.mkdir(f"./data/{market_area}")
-        if not os.path.isdir(f"./data/{market_area}/{market_type}"):
-            os.mkdir(f"./data/{market_area}/{market_type}")
+        # Tasks are generated in date order and the concat preserves it, so
+        # the frame is already sorted
+        os.makedirs(f"./data/{market_area}/{market_type}", exist_ok=True)
 
-        temp_index = pd.DatetimeIndex(df['date'])
-        frequency = temp_index.inferred_freq
+        frequency = _freq_alias(df['date'])
 
         fname = f'./data/{market_area}/{market_type}/{datetime.today().strftime("%Y-%m-%d")}_{frequency}_table.csv'
 
         print(f"Saving: {fname}")
-        df_sorted.to_csv(fname, index=False)
+        _write_csv(df, fname)
 
         print("\n")
 
 def collect_auction_market_data(start_date, end_date, sub_modality='DayAhead', auction='MRC'):
-    for market_area in [
-        'AT','BE','CH','DE-LU','DK1','DK2','FI','FR','GB','NL','NO1','NO2','NO3','NO4','NO5','PL','SE1','SE2','SE3','SE4'
-    ]:
+    # Batch all (market_area, date) requests into one pool, as in the
+    # continuous collector
+    tasks = []
+    for market_area in _AUCTION_AREAS:
         # for market_area in ['NO1','NO2','NO3','NO4','NO5','PL','SE1','SE2','SE3','SE4']:
-        df = pd.DataFrame()
+        # Only the two dates vary per area, so format the URL template once
+        url_tmpl = (
+            f"https://www.epexspot.com/en/market-data?market_area={market_area}&auction={auction}"
+            "&trading_date={trading_date}&delivery_date={delivery_date}&underlying_year=&modality=Auction"
+            f"&sub_modality={sub_modality}&technology=&data_mode=table&period=&production_period="
+        )
+
         # for market_area in ['NO1']:
         for date in pd.date_range(start=start_date, end=end_date):
             trading_date = date
@@ -336,26 +390,40 @@ def collect_auction_market_data(start_date, end_date, sub_modality='DayAhead', a
             delivery_date_str = delivery_date.strftime("%Y-%m-%d")
             print(f'auction {sub_modality} | {market_area} | {date} | {trading_date_str} -> {delivery_date_str}')
 
-            url = f"https://www.epexspot.com/en/market-data?market_area={market_area}&auction={auction}&trading_date={trading_date_str}&delivery_date={delivery_date_str}&underlying_year=&modality=Auction&sub_modality={sub_modality}&technology=&data_mode=table&period=&production_period="
+            url = url_tmpl.format(trading_date=trading_date_str, delivery_date=delivery_date_str)
+            tasks.append((market_area, delivery_date_str, url))
+
+    # The work is network-bound, so overlap the HTTPS round trips;
+    # max_workers keeps the request rate polite
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(
+            lambda task: fetch_auction_data(task[1], url=task[2]), tasks
+        ))
 
+    # Group the frames per area; task order keeps each group chronological
+    grouped = {}
+    for (market_area, _, _), df_i in zip(tasks, results):
+        if not df_i.empty:
+            grouped.setdefault(market_area, []).append(df_i)
 
-            df_i = fetch_auction_data(delivery_date_str,  url=url)
-            df = pd.concat([df,df_i])
+    for market_area in _AUCTION_AREAS:
+        # Concatenate once at the end; growing a DataFrame per date is quadratic
+        parts = grouped.get(market_area, [])
+        df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
 
         if not df.empty:
-            df_sorted = df.sort_values(by='date')
+            # Tag the area as a categorical so cross-area concatenation
+            # downstream does not duplicate the string per row
+            df['market_area'] = pd.Categorical([market_area] * len(df), categories=_AUCTION_AREAS)
 
-            if not os.path.isdir(f"./data/{market_area}"):
-                os.mkdir(f"./data/{market_area}")
-            if not os.path.isdir(f"./data/{market_area}/{sub_modality}_{auction}"):
-                os.mkdir(f"./data/{market_area}/{sub_modality}_{auction}")
+            # Already in date order (see continuous collector)
+            os.makedirs(f"./data/{market_area}/{sub_modality}_{auction}", exist_ok=True)
 
-            temp_index = pd.DatetimeIndex(df['date'])
-            frequency = temp_index.inferred_freq
+            frequency = _freq_alias(df['date'])
             fname = f'./data/{market_area}/{sub_modality}_{auction}/{datetime.today().strftime("%Y-%m-%d")}_{frequency}_table.csv'
 
             print(f"Saving: {fname}")
-            df_sorted.to_csv(fname, index=False)
+            _write_csv(df, fname)
         else:
             print(f"NO AUCTION DATA FOR area={market_area} sub_modality={sub_modality} auction={auction}")
 